@@ -2,41 +2,86 @@
 Configuration settings for the RSS pipeline
 """
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+def _env(name: str, default: Optional[str] = None, show_in_repr: bool = True):
+    """Field whose value is read from the environment when settings are built"""
+    return field(default_factory=lambda: os.getenv(name, default), repr=show_in_repr)
+
+
+def _env_int(name: str, default: int):
+    """Integer field read from the environment when settings are built"""
+    # An empty variable (NAME= in .env) falls back to the default
+    return field(default_factory=lambda: int(os.getenv(name) or default))
+
+
+def _env_path(name: str, default: str):
+    """Field holding a path (relative to BASE_DIR) read from the environment"""
+    return field(default_factory=lambda: BASE_DIR / os.getenv(name, default))
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings"""
     
     # Base paths
-    BASE_DIR = Path(__file__).resolve().parent.parent.parent
-    EXPORT_BASE_PATH = BASE_DIR / os.getenv("EXPORT_BASE_PATH", "data")
+    BASE_DIR: Path = BASE_DIR
+    EXPORT_BASE_PATH: Path = _env_path("EXPORT_BASE_PATH", "data")
+    CACHE_DIR: Path = _env_path("CACHE_DIR", ".cache")
     
     # Google Sheets
-    RSS_FEEDS_CSV_URL = os.getenv("RSS_FEEDS_CSV_URL")
-    ARTICLES_SHEET_ID = os.getenv("ARTICLES_SHEET_ID")
-    ARTICLES_WORKSHEET_NAME = os.getenv("ARTICLES_WORKSHEET_NAME", "Articles")
+    RSS_FEEDS_CSV_URL: Optional[str] = _env("RSS_FEEDS_CSV_URL")
+    ARTICLES_SHEET_ID: Optional[str] = _env("ARTICLES_SHEET_ID")
+    ARTICLES_WORKSHEET_NAME: str = _env("ARTICLES_WORKSHEET_NAME", "Articles")
     
     # Google Service Account
-    GOOGLE_SERVICE_ACCOUNT_FILE = BASE_DIR / os.getenv(
+    GOOGLE_SERVICE_ACCOUNT_FILE: Path = _env_path(
         "GOOGLE_SERVICE_ACCOUNT_FILE",
         "credentials/service_account.json"
     )
 
     # Supabase Configuration
-    SUPABASE_URL = os.getenv("SUPABASE_URL")
-    SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
-    SUPABASE_TABLE_NAME = os.getenv("SUPABASE_TABLE_NAME", "articles")
+    SUPABASE_URL: Optional[str] = _env("SUPABASE_URL")
+    SUPABASE_SERVICE_KEY: Optional[str] = _env("SUPABASE_SERVICE_KEY", show_in_repr=False)
+    SUPABASE_TABLE_NAME: str = _env("SUPABASE_TABLE_NAME", "articles")
+    SUPABASE_MAX_CONNECTIONS: int = _env_int("SUPABASE_MAX_CONNECTIONS", 20)
+
+    # Batch sizes for bulk writes
+    GSHEET_BATCH_SIZE: int = 500
+    SUPABASE_BATCH_SIZE: int = 500
+    SUPABASE_WRITE_WORKERS: int = 4
+    SUPABASE_CACHE_TTL: int = 60  # seconds recent articles are served from memory
+    SUPABASE_URL_CACHE_SIZE: int = 4096
+    SUPABASE_URL_CACHE_TTL: int = 30  # seconds single-article lookups are served from memory
 
     # Logging
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = _env("LOG_LEVEL", "INFO")
     
     # Article extraction
-    REQUEST_TIMEOUT = 30
-    USER_AGENT = "Mozilla/5.0 (compatible; MinervaRSS/1.0)"
+    REQUEST_TIMEOUT: int = 30
+    USER_AGENT: str = "Mozilla/5.0 (compatible; MinervaRSS/1.0)"
+    MIN_CONTENT_LENGTH: int = 800  # characters required to export an article
+    MIN_FEED_CONTENT_LENGTH: int = 800  # characters of in-feed HTML (content:encoded) used instead of downloading the page
+    CONTENT_CACHE_TTL: int = 30 * 24 * 3600  # seconds extracted contents are kept
+
+    # Concurrency / rate limiting
+    FEED_FETCH_WORKERS: int = 16
+    CONTENT_FETCH_WORKERS: int = 8
+    HTTP_POOL_SIZE: int = 64
+    PER_HOST_CONCURRENCY: int = 4
+    RATE_LIMIT_DELAY: float = 1  # seconds between requests to the same host
+    EXPORT_WORKERS: int = 8
+    CONVERSION_WORKERS: int = os.cpu_count() or 1
     
     def validate(self):
         """Validate required settings"""
@@ -53,4 +98,11 @@ class Settings:
         if not self.SUPABASE_SERVICE_KEY:
             raise ValueError("SUPABASE_SERVICE_KEY is required")
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the application settings from the environment (once per process)"""
+    return Settings()
+
+
+settings = get_settings()
@@ -2,17 +2,45 @@
 Markdown Exporter
 Exports articles to markdown files with frontmatter
 """
-import frontmatter
+import json
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from slugify import slugify
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from src.config import settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+WRITE_BUFFER_SIZE = 1 << 20
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Article fields written to the YAML front matter, in order
+FRONTMATTER_FIELDS = (
+    "title", "url", "author", "published_date",
+    "feed_name", "feed_url", "domain", "extracted_at",
+)
+
+
+def _yaml_scalar(value) -> str:
+    """Render a value as a YAML scalar (JSON strings are valid YAML)"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+@lru_cache(maxsize=512)
+def _slug_domain(domain: str) -> str:
+    """Slugify a domain (few distinct values, heavily repeated)"""
+    return slugify(domain)
+
+
+@lru_cache(maxsize=4096)
+def _slug_title(title: str) -> str:
+    """Slugify an article title for use as file name"""
+    return slugify(title, max_length=100)
+
 
 class MarkdownExporter:
     """Export articles to markdown files"""
@@ -20,24 +48,25 @@ class MarkdownExporter:
     def __init__(self, base_path: Path = None):
         self.base_path = base_path or settings.EXPORT_BASE_PATH
         self.base_path.mkdir(parents=True, exist_ok=True)
+        
+        # Directories already created by this exporter
+        self._created_dirs: Set[Path] = {self.base_path}
     
-    def export_article(self, article: Dict) -> Path:
+    def export_article(self, article: Dict, create_dirs: bool = True) -> Path:
         """
         Export a single article to markdown file
         
         Args:
             article: Article dictionary
+            create_dirs: Create the target directory if needed (pass False
+                when directories were created beforehand)
             
         Returns:
             Path to the created file
         """
         try:
             # Check content length
-            content_text = article.get("full_content") or article.get("summary", "")
-            if len(content_text) < 800:
-                logger.warning(
-                    f"Article '{article.get('title')}' has less than 800 characters ({len(content_text)}), skipping export"
-                )
+            if not self._has_enough_content(article):
                 return None
             
             # Build file path
@@ -47,11 +76,12 @@ class MarkdownExporter:
             content = self._create_markdown_content(article)
             
             # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if create_dirs:
+                self._create_dirs([file_path.parent])
             
             # Write file
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(frontmatter.dumps(content))
+                f.write(content)
             
             logger.info(f"Exported article to: {file_path}")
             return file_path
@@ -64,26 +94,71 @@ class MarkdownExporter:
         """
         Export multiple articles
         
+        Serializes every article first, creates each target directory once,
+        then writes the files from a thread pool.
+        
         Args:
             articles: List of article dictionaries
             
-        Returns:if path:  # Only add if file was actually created
-                    
+        Returns:
             List of paths to created files
         """
-        exported_paths = []
+        jobs: List[Tuple[Path, bytes]] = []
         
         for article in articles:
+            if not self._has_enough_content(article):
+                continue
+            
             try:
-                path = self.export_article(article)
-                exported_paths.append(path)
+                file_path = self._build_file_path(article)
+                content = self._create_markdown_content(article)
+                jobs.append((file_path, content.encode("utf-8")))
             except Exception as e:
                 logger.warning(f"Failed to export article: {e}")
                 continue
         
+        # Create each target directory only once
+        self._create_dirs(file_path.parent for file_path, _ in jobs)
+        
+        with ThreadPoolExecutor(max_workers=settings.EXPORT_WORKERS) as executor:
+            exported_paths = [
+                path for path in executor.map(self._write_file, jobs) if path
+            ]
+        
         logger.info(f"Exported {len(exported_paths)} articles")
         return exported_paths
     
+    def _create_dirs(self, directories: Iterable[Path]):
+        """Create the given directories, skipping those already created"""
+        for directory in set(directories) - self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def _write_file(self, job: Tuple[Path, bytes]) -> Optional[Path]:
+        """Write a serialized article, returning its path on success"""
+        file_path, data = job
+        try:
+            with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(data)
+            
+            logger.info(f"Exported article to: {file_path}")
+            return file_path
+            
+        except Exception as e:
+            logger.warning(f"Failed to export article to {file_path}: {e}")
+            return None
+    
+    def _has_enough_content(self, article: Dict) -> bool:
+        """Check that the article is long enough to be exported"""
+        content_text = article.get("full_content") or article.get("summary", "")
+        if len(content_text) < settings.MIN_CONTENT_LENGTH:
+            logger.warning(
+                f"Article '{article.get('title')}' has less than {settings.MIN_CONTENT_LENGTH} "
+                f"characters ({len(content_text)}), skipping export"
+            )
+            return False
+        return True
+    
     def _build_file_path(self, article: Dict) -> Path:
         """
         Build file path following pattern:
@@ -92,21 +167,20 @@ class MarkdownExporter:
         # Extract date components
         published_date = article.get("published_date", "")
         try:
-            dt = datetime.strptime(published_date, "%Y-%m-%d %H:%M:%S")
+            dt = datetime.strptime(published_date, DATE_FORMAT)
         except (ValueError, TypeError):
             dt = datetime.now()
         
-        year = dt.strftime("%Y")
-        month = dt.strftime("%m")
-        date = dt.strftime("%Y-%m-%d")
+        # YYYY-MM-DD prefix of the ISO format
+        date = dt.isoformat()[:10]
+        year = date[:4]
+        month = date[5:7]
         
         # Sanitize domain
-        domain = article.get("domain", "unknown")
-        domain = slugify(domain)
+        domain = _slug_domain(article.get("domain", "unknown"))
         
         # Sanitize article name
-        title = article.get("title", "untitled")
-        article_slug = slugify(title, max_length=100)
+        article_slug = _slug_title(article.get("title", "untitled"))
         
         # Build path
         file_name = f"{date}_{article_slug}.md"
@@ -120,25 +194,21 @@ class MarkdownExporter:
         
         return file_path
     
-    def _create_markdown_content(self, article: Dict) -> frontmatter.Post:
-        """Create markdown post with frontmatter"""
+    def _create_markdown_content(self, article: Dict) -> str:
+        """Create markdown document with YAML front matter"""
         # Determine content
         content = article.get("full_content") or article.get("summary", "")
         
-        # Create post
-        post = frontmatter.Post(content)
-        
         # Add metadata
-        post['title'] = article.get("title", "")
-        post['url'] = article.get("url", "")
-        post['author'] = article.get("author", "")
-        post['published_date'] = article.get("published_date", "")
-        post['feed_name'] = article.get("feed_name", "")
-        post['feed_url'] = article.get("feed_url", "")
-        post['domain'] = article.get("domain", "")
-        post['extracted_at'] = article.get("extracted_at", "")
+        lines = ["---"]
+        lines.extend(
+            f"{field}: {_yaml_scalar(article.get(field, ''))}"
+            for field in FRONTMATTER_FIELDS
+        )
         
         if article.get("summary"):
-            post['summary'] = article.get("summary")
+            lines.append(f"summary: {_yaml_scalar(article.get('summary'))}")
+        
+        lines.append("---")
         
-        return post
+        return "\n".join(lines) + f"\n\n{content}\n"
@@ -2,10 +2,9 @@
 Minerva RSS - Main Pipeline
 Extract articles from RSS feeds and export to markdown
 """
-from datetime import datetime
 from src.config import settings
 from src.services import RSSFetcher, GSheetService, ArticleProcessor
-from src.services.supabase_service import SupabaseService
+from src.services.supabase_service import get_supabase_service
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,6 +12,7 @@ logger = get_logger(__name__)
 
 def main():
     """Main pipeline execution"""
+    rss_fetcher = None
     try:
         # Validate settings
         logger.info("Starting Minerva RSS Pipeline")
@@ -21,7 +21,7 @@ def main():
         # Initialize services
         logger.info("Initializing services...")
         gsheet_service = GSheetService()
-        supabase_service = SupabaseService()
+        supabase_service = get_supabase_service()
         rss_fetcher = RSSFetcher()
         processor = ArticleProcessor()
         
@@ -34,40 +34,39 @@ def main():
             logger.warning("No RSS feeds found. Exiting.")
             return
         
-        # Step 2: Fetch articles from RSS feeds
-        logger.info("Step 2: Fetching articles from RSS feeds...")
-        fetched_articles = rss_fetcher.fetch_feeds(rss_feeds)
+        # Step 2: Get existing articles from Google Sheet and Supabase
+        logger.info("Step 2a: Retrieving existing articles from Google Sheet...")
+        processor.load_existing_urls(gsheet_service.get_existing_urls())
+
+        logger.info("Step 2b: Retrieving existing articles from Supabase...")
+        existing_supabase_urls = supabase_service.get_existing_urls()
+        logger.info(f"Found {len(existing_supabase_urls)} existing articles in Supabase")
+
+        # Step 3: Fetch articles from RSS feeds (no full content extraction
+        # for articles already stored everywhere)
+        logger.info("Step 3: Fetching articles from RSS feeds...")
+        known_urls = processor.existing_urls & existing_supabase_urls
+        fetched_articles = rss_fetcher.fetch_feeds(rss_feeds, known_urls=known_urls)
         logger.info(f"Fetched {len(fetched_articles)} total articles")
+        fetched_articles = processor.deduplicate(fetched_articles)
         
         if not fetched_articles:
             logger.warning("No articles fetched. Exiting.")
             return
-        
-        # Step 3: Get existing articles from Google Sheet
-        logger.info("Step 3: Retrieving existing articles from Google Sheet...")
-        existing_articles_gsheet = gsheet_service.get_existing_articles()
-        processor.load_existing_articles(existing_articles_gsheet)
 
         # Step 4: Compare and filter new articles for Google Sheets
         logger.info("Step 4: Comparing articles to identify new ones for Google Sheets...")
         new_articles_for_gsheet, duplicate_articles = processor.filter_new_articles(fetched_articles)
         logger.info(f"Found {len(new_articles_for_gsheet)} new articles for Google Sheets, {len(duplicate_articles)} duplicates")
 
-        # Step 4b: Get existing articles from Supabase
-        logger.info("Step 4b: Retrieving existing articles from Supabase...")
-        existing_articles_supabase = supabase_service.get_existing_articles()
-        existing_supabase_urls = {article.get("url", "").strip() for article in existing_articles_supabase if article.get("url")}
-        logger.info(f"Found {len(existing_supabase_urls)} existing articles in Supabase")
-
-        # Step 4c: Filter new articles for Supabase
-        new_articles_for_supabase = [
-            article for article in fetched_articles
-            if article.get("url", "").strip() not in existing_supabase_urls
-        ]
+        # Step 4b: Filter new articles for Supabase
+        logger.info("Step 4b: Comparing articles to identify new ones for Supabase...")
+        new_articles_for_supabase, _ = processor.filter_against(existing_supabase_urls, fetched_articles)
         logger.info(f"Found {len(new_articles_for_supabase)} new articles for Supabase")
 
         if not new_articles_for_gsheet and not new_articles_for_supabase:
             logger.info("No new articles to process. Exiting.")
+            rss_fetcher.save_feed_validators()
             return
         
         # Step 5: Add new articles to Google Sheet (only new ones for GSheet)
@@ -83,27 +82,16 @@ def main():
         # Step 5b: Add new articles to Supabase (only new ones for Supabase)
         if new_articles_for_supabase:
             logger.info("Step 5b: Adding new articles to Supabase...")
-            storage_articles_supabase = []
-            for article in new_articles_for_supabase:
-                storage_article = {
-                    "title": article.get("title", ""),
-                    "url": article.get("url", ""),
-                    "summary": article.get("summary", ""),
-                    "author": article.get("author", ""),
-                    "published_date": article.get("published_date", ""),
-                    "feed_name": article.get("feed_name", ""),
-                    "domain": article.get("domain", ""),
-                    "extracted_at": article.get("extracted_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-                    "has_full_content": bool(article.get("full_content", "")),
-                }
-                storage_articles_supabase.append(storage_article)
-
-            supabase_service.add_articles(storage_articles_supabase)
+            storage_articles_supabase = processor.prepare_for_supabase(new_articles_for_supabase)
+            supabase_service.add_articles(storage_articles_supabase, existing_urls=existing_supabase_urls)
             logger.info(f"Added {len(storage_articles_supabase)} articles to Supabase")
         else:
             logger.info("Step 5b: No new articles to add to Supabase")
             storage_articles_supabase = []
         
+        # Everything is stored: unchanged feeds can be skipped next run
+        rss_fetcher.save_feed_validators()
+        
         # Summary
         logger.info("=" * 60)
         logger.info("Pipeline completed successfully!")
@@ -117,6 +105,10 @@ def main():
     except Exception as e:
         logger.error(f"Pipeline failed with error: {e}", exc_info=True)
         raise
+    
+    finally:
+        if rss_fetcher is not None:
+            rss_fetcher.close()
 
 
 if __name__ == "__main__":
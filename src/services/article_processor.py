@@ -2,9 +2,10 @@
 Article Processor Service
 Compares and processes articles
 """
-from typing import List, Dict, Tuple
+from typing import List, Dict, Set, Tuple
 from datetime import datetime
 
+from src.utils.helpers import normalize_url
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,12 +24,53 @@ class ArticleProcessor:
         Args:
             existing_articles: List of existing article dictionaries
         """
-        self.existing_urls = {
-            article.get("url", "").strip() 
-            for article in existing_articles 
+        self.existing_urls = self.extract_urls(existing_articles)
+        logger.info(f"Loaded {len(self.existing_urls)} existing article URLs")
+    
+    def load_existing_urls(self, existing_urls: Set[str]):
+        """
+        Load existing article URLs for comparison
+        
+        Args:
+            existing_urls: Set of normalized URLs already stored
+        """
+        self.existing_urls = set(existing_urls)
+        logger.info(f"Loaded {len(self.existing_urls)} existing article URLs")
+    
+    def extract_urls(self, articles: List[Dict]) -> Set[str]:
+        """
+        Build the set of normalized URLs of a list of articles
+        
+        Args:
+            articles: List of article dictionaries
+            
+        Returns:
+            Set of normalized URLs
+        """
+        return {
+            normalize_url(article["url"])
+            for article in articles
             if article.get("url")
         }
-        logger.info(f"Loaded {len(self.existing_urls)} existing article URLs")
+    
+    def deduplicate(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Remove articles sharing the same URL (e.g. syndicated in several feeds)
+        
+        Args:
+            articles: List of article dictionaries
+            
+        Returns:
+            Articles with unique URLs (last seen article wins)
+        """
+        unique_articles = list({
+            normalize_url(article["url"]): article
+            for article in articles
+            if article.get("url")
+        }.values())
+        
+        logger.info(f"Removed {len(articles) - len(unique_articles)} duplicate fetched articles")
+        return unique_articles
     
     def filter_new_articles(self, fetched_articles: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
         """
@@ -40,16 +82,25 @@ class ArticleProcessor:
         Returns:
             Tuple of (new_articles, existing_articles)
         """
-        new_articles = []
-        existing_articles = []
+        return self.filter_against(self.existing_urls, fetched_articles)
+    
+    def filter_against(self, existing_urls: Set[str], fetched_articles: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Filter articles into new and existing against a given set of URLs
         
-        for article in fetched_articles:
-            url = article.get("url", "").strip()
+        Args:
+            existing_urls: Set of normalized URLs already stored
+            fetched_articles: List of fetched article dictionaries
             
-            if url in self.existing_urls:
-                existing_articles.append(article)
-            else:
-                new_articles.append(article)
+        Returns:
+            Tuple of (new_articles, existing_articles)
+        """
+        # Normalize each URL once, then diff the whole set at C level
+        keyed = [(normalize_url(article.get("url", "")), article) for article in fetched_articles]
+        new_urls = {url for url, _ in keyed} - existing_urls
+        
+        new_articles = [article for url, article in keyed if url in new_urls]
+        existing_articles = [article for url, article in keyed if url not in new_urls]
         
         logger.info(f"Found {len(new_articles)} new articles and {len(existing_articles)} existing articles")
         
@@ -130,3 +181,33 @@ class ArticleProcessor:
             storage_ready.append(storage_article)
         
         return storage_ready
+    
+    def prepare_for_supabase(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Prepare articles for Supabase storage
+        
+        Args:
+            articles: List of article dictionaries
+            
+        Returns:
+            Articles formatted for the Supabase articles table
+        """
+        storage_ready = []
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        for article in articles:
+            storage_article = {
+                "title": article.get("title", ""),
+                "url": article.get("url", ""),
+                "summary": article.get("summary", ""),
+                "author": article.get("author", ""),
+                "published_date": article.get("published_date", ""),
+                "feed_name": article.get("feed_name", ""),
+                "domain": article.get("domain", ""),
+                "extracted_at": article.get("extracted_at", current_time),
+                "has_full_content": bool(article.get("full_content")),
+            }
+            
+            storage_ready.append(storage_article)
+        
+        return storage_ready
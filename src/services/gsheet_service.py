@@ -3,45 +3,76 @@ Google Sheets Service
 Handles reading and writing to Google Sheets
 """
 import gspread
+from gspread.utils import ValueInputOption, rowcol_to_a1
 from google.oauth2.service_account import Credentials
-import requests
 import csv
-from typing import List, Dict
-from io import StringIO
+from functools import lru_cache
+from typing import List, Dict, Optional, Set
+from io import TextIOWrapper
 
 from src.config import settings
+from src.utils.helpers import chunked, normalize_url
+from src.utils.http import get_http_session
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+
+
+@lru_cache(maxsize=4)
+def _get_client(service_account_file: str) -> gspread.Client:
+    """Build an authorized gspread client, once per credentials file"""
+    creds = Credentials.from_service_account_file(
+        service_account_file,
+        scopes=SCOPES
+    )
+    return gspread.authorize(creds)
+
+
+@lru_cache(maxsize=8)
+def _open_worksheet(client: gspread.Client, sheet_id: str, worksheet_name: str) -> gspread.Worksheet:
+    """Open a worksheet, once per client/sheet/worksheet"""
+    sheet = client.open_by_key(sheet_id)
+    return sheet.worksheet(worksheet_name)
+
 
 class GSheetService:
     """Service to interact with Google Sheets"""
     
     def __init__(self):
         self.client = None
+        self.session = get_http_session()
+        self._headers: Optional[List[str]] = None
         self._authenticate()
     
     def _authenticate(self):
         """Authenticate with Google Sheets API"""
         try:
-            scopes = [
-                "https://www.googleapis.com/auth/spreadsheets",
-                "https://www.googleapis.com/auth/drive",
-            ]
-            
-            creds = Credentials.from_service_account_file(
-                settings.GOOGLE_SERVICE_ACCOUNT_FILE,
-                scopes=scopes
-            )
-            
-            self.client = gspread.authorize(creds)
+            self.client = _get_client(str(settings.GOOGLE_SERVICE_ACCOUNT_FILE))
             logger.info("Successfully authenticated with Google Sheets")
             
         except Exception as e:
             logger.error(f"Failed to authenticate with Google Sheets: {e}")
             raise
     
+    def _get_worksheet(self) -> gspread.Worksheet:
+        """Get the articles worksheet (cached across calls)"""
+        return _open_worksheet(
+            self.client,
+            settings.ARTICLES_SHEET_ID,
+            settings.ARTICLES_WORKSHEET_NAME
+        )
+    
+    def _get_headers(self, worksheet: gspread.Worksheet) -> List[str]:
+        """Get the worksheet header row (fetched once per service)"""
+        if self._headers is None:
+            self._headers = worksheet.row_values(1)
+        return self._headers
+    
     def get_rss_feeds_from_csv(self) -> List[Dict]:
         """
         Fetch RSS feeds configuration from published Google Sheet CSV
@@ -50,22 +81,25 @@ class GSheetService:
             List of dicts with keys: url, name, description, extract_articles
         """
         try:
-            response = requests.get(settings.RSS_FEEDS_CSV_URL, timeout=30)
-            response.raise_for_status()
-            
-            # Parse CSV
-            csv_data = StringIO(response.text)
-            reader = csv.DictReader(csv_data)
-            
             feeds = []
-            for row in reader:
-                if row.get("url"):  # Skip empty rows
-                    feeds.append({
-                        "url": row.get("url", "").strip(),
-                        "name": row.get("name", "").strip(),
-                        "description": row.get("description", "").strip(),
-                        "extract_articles": row.get("extract_articles", "false").strip(),
-                    })
+            with self.session.get(settings.RSS_FEEDS_CSV_URL, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                
+                # Parse CSV while it downloads (newline="" keeps quoted
+                # multi-line fields intact)
+                response.raw.decode_content = True
+                response.raw.auto_close = False
+                csv_data = TextIOWrapper(response.raw, encoding="utf-8", newline="")
+                reader = csv.DictReader(csv_data)
+                
+                for row in reader:
+                    if row.get("url"):  # Skip empty rows
+                        feeds.append({
+                            "url": row.get("url", "").strip(),
+                            "name": row.get("name", "").strip(),
+                            "description": row.get("description", "").strip(),
+                            "extract_articles": row.get("extract_articles", "false").strip(),
+                        })
             
             logger.info(f"Retrieved {len(feeds)} RSS feeds from CSV")
             return feeds
@@ -82,8 +116,7 @@ class GSheetService:
             List of article dictionaries
         """
         try:
-            sheet = self.client.open_by_key(settings.ARTICLES_SHEET_ID)
-            worksheet = sheet.worksheet(settings.ARTICLES_WORKSHEET_NAME)
+            worksheet = self._get_worksheet()
             
             # Get all records as dictionaries
             records = worksheet.get_all_records()
@@ -95,6 +128,33 @@ class GSheetService:
             logger.error(f"Error fetching existing articles: {e}")
             return []
     
+    def get_existing_urls(self) -> Set[str]:
+        """
+        Get the URLs of all existing articles from Google Sheet
+        
+        Only downloads the url column, which is all deduplication needs.
+        
+        Returns:
+            Set of normalized article URLs
+        """
+        try:
+            worksheet = self._get_worksheet()
+            headers = self._get_headers(worksheet)
+            
+            if "url" not in headers:
+                logger.warning("No url column found in sheet")
+                return set()
+            
+            values = worksheet.col_values(headers.index("url") + 1)
+            urls = {normalize_url(value) for value in values[1:] if value}
+            
+            logger.info(f"Retrieved {len(urls)} existing article URLs from sheet")
+            return urls
+            
+        except Exception as e:
+            logger.error(f"Error fetching existing article URLs: {e}")
+            return set()
+    
     def add_articles(self, articles: List[Dict]):
         """
         Add new articles to Google Sheet
@@ -107,11 +167,10 @@ class GSheetService:
             return
         
         try:
-            sheet = self.client.open_by_key(settings.ARTICLES_SHEET_ID)
-            worksheet = sheet.worksheet(settings.ARTICLES_WORKSHEET_NAME)
+            worksheet = self._get_worksheet()
             
             # Get headers
-            headers = worksheet.row_values(1)
+            headers = self._get_headers(worksheet)
             
             # If sheet is empty, add headers
             if not headers:
@@ -120,6 +179,7 @@ class GSheetService:
                     "feed_name", "domain", "extracted_at", "has_full_content", "labels", "ratings", "readers"
                 ]
                 worksheet.append_row(headers)
+                self._headers = headers
             
             # Prepare rows
             rows = []
@@ -140,8 +200,9 @@ class GSheetService:
                 ]
                 rows.append(row)
             
-            # Batch append
-            worksheet.append_rows(rows)
+            # Append in fixed-size batches to stay under API request limits
+            for chunk in chunked(rows, settings.GSHEET_BATCH_SIZE):
+                worksheet.append_rows(chunk, value_input_option="RAW")
             logger.info(f"Added {len(articles)} articles to Google Sheet")
             
         except Exception as e:
@@ -157,22 +218,27 @@ class GSheetService:
             updates: Dictionary of fields to update
         """
         try:
-            sheet = self.client.open_by_key(settings.ARTICLES_SHEET_ID)
-            worksheet = sheet.worksheet(settings.ARTICLES_WORKSHEET_NAME)
+            worksheet = self._get_worksheet()
             
             # Find the cell with the URL
             cell = worksheet.find(url)
             
             if cell:
                 # Get headers to map column names
-                headers = worksheet.row_values(1)
+                headers = self._get_headers(worksheet)
                 row_num = cell.row
                 
-                # Update each field
-                for field, value in updates.items():
-                    if field in headers:
-                        col_num = headers.index(field) + 1
-                        worksheet.update_cell(row_num, col_num, value)
+                # Update all fields in a single request
+                data = [
+                    {
+                        "range": rowcol_to_a1(row_num, headers.index(field) + 1),
+                        "values": [[value]],
+                    }
+                    for field, value in updates.items()
+                    if field in headers
+                ]
+                if data:
+                    worksheet.batch_update(data, value_input_option=ValueInputOption.user_entered)
                 
                 logger.info(f"Updated article: {url}")
             else:
@@ -3,85 +3,247 @@ RSS Feed Fetcher Service
 Retrieves and parses RSS feeds, extracts full article content
 """
 import feedparser
-import requests
+from diskcache import Cache
 from readability import Document
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import html2text
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from datetime import datetime
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import json
+import multiprocessing
+import threading
 import time
 from urllib.parse import urlparse
 
 from src.config import settings
+from src.utils.helpers import normalize_url
+from src.utils.http import get_http_session
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+FEED_VALIDATORS_FILE = "feeds.json"
+CONTENT_CACHE_DIR = "articles"
+
+# Runs of spaces/tabs, and line breaks with their surrounding whitespace
+_WS_RUN = re.compile(r"[ \t]+")
+_NL_RUN = re.compile(r"\s*\n\s*")
+
+# Elements that end a line of text; inline tags (a, em, ...) do not
+_BLOCK_TAGS = "p, div, br, li, tr, blockquote, pre, h1, h2, h3, h4, h5, h6"
+
+# Host part of an http(s) URL, without user info and the www. prefix
+_DOMAIN_RE = re.compile(r"https?://(?:[^@/?#]*@)?(?:www\.)?([^/?#]+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _get_html_converter() -> html2text.HTML2Text:
+    """Return the html2text converter of the current (worker) process"""
+    converter = html2text.HTML2Text()
+    converter.ignore_links = False
+    converter.ignore_images = False
+    converter.ignore_emphasis = False
+    converter.body_width = 0  # Don't wrap lines
+    return converter
+
+
+def _html_to_markdown(html: str, extract_main: bool = False) -> str:
+    """
+    Convert HTML to markdown, in a conversion worker process
+    
+    Args:
+        html: HTML to convert
+        extract_main: Keep only the main content (readability) first
+        
+    Returns:
+        Markdown content
+    """
+    if extract_main:
+        html = Document(html).summary()
+    
+    # Convert HTML to markdown (keeps structure, images, links)
+    return _get_html_converter().handle(html).strip()
+
+
+@lru_cache(maxsize=8192)
+def _extract_domain(url: str) -> str:
+    """Extract the domain of an article URL"""
+    match = _DOMAIN_RE.match(url)
+    if match:
+        return match.group(1).lower()
+    
+    # Protocol-relative (//host/x) and other schemes
+    try:
+        domain = urlparse(url).hostname or ""
+    except ValueError:
+        return ""
+    return domain[4:] if domain.startswith("www.") else domain
+
 
 class RSSFetcher:
     """Service to fetch and parse RSS feeds"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": settings.USER_AGENT})
+        # One pooled session shared by every worker thread; keep-alive
+        # connections are reused across feeds and article fetches
+        self.session = get_http_session()
+        
+        # Per-host rate limiting (one semaphore per netloc)
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._host_slots_lock = threading.Lock()
         
-        # Configure html2text converter
-        self.html_converter = html2text.HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.ignore_images = False
-        self.html_converter.ignore_emphasis = False
-        self.html_converter.body_width = 0  # Don't wrap lines
+        # readability and html2text are CPU-bound pure Python: run them in
+        # worker processes so conversions scale across cores
+        self._conversion_pool = self._new_conversion_pool()
+        self._conversion_pool_lock = threading.Lock()
+        
+        # Extracted article contents, persisted across runs
+        self._content_cache = Cache(str(settings.CACHE_DIR / CONTENT_CACHE_DIR))
+        
+        # HTTP validators (ETag / Last-Modified) of each feed, from the
+        # previous successful run and from this run
+        self._validators_path = settings.CACHE_DIR / FEED_VALIDATORS_FILE
+        self._feed_validators = self._load_feed_validators()
+        self._new_feed_validators: Dict[str, Dict[str, str]] = {}
+        self._validators_lock = threading.Lock()
+    
+    def __enter__(self) -> "RSSFetcher":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
-    def fetch_feeds(self, feed_urls: List[Dict]) -> List[Dict]:
+    def close(self):
+        """Stop the conversion workers and close the content cache"""
+        self._conversion_pool.shutdown(wait=True, cancel_futures=True)
+        self._content_cache.close()
+    
+    def fetch_feeds(self, feed_urls: List[Dict], known_urls: Optional[Set[str]] = None) -> List[Dict]:
         """
         Fetch articles from multiple RSS feeds
         
         Args:
             feed_urls: List of dicts with keys: url, name, description, extract_articles
+            known_urls: Normalized URLs already stored, whose full content
+                is not extracted again
             
         Returns:
             List of article dictionaries
         """
-        all_articles = []
+        results: Dict[int, List[Dict]] = {}
         
-        for feed_config in feed_urls:
-            feed_url = feed_config.get("url")
-            feed_name = feed_config.get("name", "Unknown")
-            extract_articles = feed_config.get("extract_articles", "false").lower() == "true"
-            
-            logger.info(f"Fetching RSS feed: {feed_name} ({feed_url})")
+        with ThreadPoolExecutor(max_workers=settings.FEED_FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(self._fetch_feed, feed_config, known_urls or set()): index
+                for index, feed_config in enumerate(feed_urls)
+            }
             
-            try:
-                articles = self._parse_feed(feed_url, feed_name, extract_articles, feed_url)
-                all_articles.extend(articles)
-                logger.info(f"Retrieved {len(articles)} articles from {feed_name}")
-                
-                # Rate limiting
-                time.sleep(1)
+            for future in as_completed(futures):
+                index = futures[future]
+                feed_name = feed_urls[index].get("name", "Unknown")
                 
-            except Exception as e:
-                logger.error(f"Error fetching feed {feed_name}: {e}")
-                continue
+                try:
+                    articles = future.result()
+                    results[index] = articles
+                    logger.info(f"Retrieved {len(articles)} articles from {feed_name}")
+                except Exception as e:
+                    logger.error(f"Error fetching feed {feed_name}: {e}")
+        
+        # Keep the configured feed order regardless of completion order
+        all_articles = []
+        for index in sorted(results):
+            all_articles.extend(results[index])
         
         return all_articles
     
-    def _parse_feed(self, feed_url: str, feed_name: str, extract_full: bool, rss_feed_url: str = "") -> List[Dict]:
+    def _fetch_feed(self, feed_config: Dict, known_urls: Set[str]) -> List[Dict]:
+        """Fetch a single feed described by its configuration row"""
+        feed_url = feed_config.get("url")
+        feed_name = feed_config.get("name", "Unknown")
+        extract_articles = feed_config.get("extract_articles", "false").lower() == "true"
+        
+        logger.info(f"Fetching RSS feed: {feed_name} ({feed_url})")
+        return self._parse_feed(feed_url, feed_name, extract_articles, feed_url, known_urls)
+    
+    def _parse_feed(
+        self,
+        feed_url: str,
+        feed_name: str,
+        extract_full: bool,
+        rss_feed_url: str = "",
+        known_urls: Optional[Set[str]] = None
+    ) -> List[Dict]:
         """Parse a single RSS feed"""
-        feed = feedparser.parse(feed_url)
+        # Conditional GET: unchanged feeds answer 304 without a body
+        request_headers = {}
+        validators = self._feed_validators.get(feed_url, {})
+        if validators.get("etag"):
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+        
+        with self._throttle(feed_url):
+            response = self.session.get(
+                feed_url,
+                headers=request_headers,
+                timeout=settings.REQUEST_TIMEOUT
+            )
+        
+        if response.status_code == 304:
+            logger.info(f"Feed not modified since last run: {feed_name}")
+            return []
+        response.raise_for_status()
+        self._remember_validators(feed_url, response)
+        
+        # Pass the response headers so feedparser can detect the encoding
+        # and resolve relative links against the final feed URL
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        headers["content-location"] = response.url
+        feed = feedparser.parse(response.content, response_headers=headers)
         articles = []
+        known_urls = known_urls or set()
         
         for entry in feed.entries:
             try:
-                article = self._parse_entry(entry, feed_name, extract_full, rss_feed_url)
+                article = self._parse_entry(entry, feed_name, extract_full, rss_feed_url, known_urls)
                 if article:
                     articles.append(article)
             except Exception as e:
                 logger.warning(f"Error parsing entry: {e}")
                 continue
         
+        # Fetch missing full contents in parallel, throttled per host
+        to_extract = [
+            article for article in articles
+            if extract_full
+            and article["full_content"] is None
+            and normalize_url(article["url"]) not in known_urls
+        ]
+        if to_extract:
+            with ThreadPoolExecutor(max_workers=settings.CONTENT_FETCH_WORKERS) as executor:
+                contents = executor.map(
+                    self._extract_full_content,
+                    [article["url"] for article in to_extract]
+                )
+                for article, full_content in zip(to_extract, contents):
+                    article["full_content"] = full_content
+        
         return articles
     
-    def _parse_entry(self, entry, feed_name: str, extract_full: bool, rss_feed_url: str = "") -> Optional[Dict]:
+    def _parse_entry(
+        self,
+        entry,
+        feed_name: str,
+        extract_full: bool,
+        rss_feed_url: str = "",
+        known_urls: Optional[Set[str]] = None
+    ) -> Optional[Dict]:
         """Parse a single RSS entry"""
         # Extract basic info
         title = entry.get("title", "").strip()
@@ -100,22 +262,21 @@ class RSSFetcher:
         # Extract author
         author = entry.get("author", "") or entry.get("creator", "")
         
-        # Extract full content if needed
+        # Use the full text shipped in the feed (content:encoded) when there
+        # is one, so the article page doesn't need to be downloaded. Articles
+        # already stored everywhere skip the conversion.
         full_content = None
-        if extract_full:
-            full_content = self._extract_full_content(link)
+        if extract_full and not (known_urls and normalize_url(link) in known_urls):
+            full_content = self._get_feed_content(entry)
         
-        # Extract domain
-        domain = urlparse(link).netloc
-        # Remove www. prefix if present
-        if domain.startswith("www."):
-            domain = domain[4:]
+        # Extract domain (without www. prefix)
+        domain = _extract_domain(link)
         
         return {
             "title": title,
             "url": link,
             "summary": summary_clean,
-            "full_content": full_content,
+            "full_content": full_content,  # Fetched by _parse_feed if missing
             "author": author,
             "published_date": published_date,
             "feed_name": feed_name,
@@ -124,45 +285,159 @@ class RSSFetcher:
             "extract_articles": extract_full,
         }
     
+    def _get_feed_content(self, entry) -> Optional[str]:
+        """Convert the entry's embedded full content to markdown, if long enough"""
+        contents = entry.get("content") or []
+        if not contents:
+            return None
+        
+        html_content = contents[0].get("value", "")
+        if len(html_content) < settings.MIN_FEED_CONTENT_LENGTH:
+            return None
+        
+        try:
+            return self._convert(html_content)
+        except Exception as e:
+            # Keep the entry; _parse_feed falls back to the article page
+            logger.warning(f"Could not convert feed content of {entry.get('link', '')}: {e}")
+            return None
+    
     def _extract_full_content(self, url: str) -> Optional[str]:
         """Extract full article content using readability and convert to markdown"""
+        cache_key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        cached_content = self._content_cache.get(cache_key)
+        if cached_content is not None:
+            return cached_content
+        
         try:
-            response = self.session.get(url, timeout=settings.REQUEST_TIMEOUT)
+            with self._throttle(url):
+                response = self.session.get(url, timeout=settings.REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            # Use readability to extract main content
-            doc = Document(response.text)
-            html_content = doc.summary()
+            # Extract main content and convert it to markdown
+            markdown_content = self._convert(response.text, extract_main=True)
             
-            # Convert HTML to markdown (keeps structure, images, links)
-            markdown_content = self.html_converter.handle(html_content)
-            
-            return markdown_content.strip()
+            self._content_cache.set(cache_key, markdown_content, expire=settings.CONTENT_CACHE_TTL)
+            return markdown_content
             
         except Exception as e:
             logger.warning(f"Could not extract full content from {url}: {e}")
             return None
     
+    def _new_conversion_pool(self) -> ProcessPoolExecutor:
+        """Start conversion workers ("spawn" avoids forking while fetch threads hold locks)"""
+        return ProcessPoolExecutor(
+            max_workers=settings.CONVERSION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    
+    def _convert(self, html: str, extract_main: bool = False) -> str:
+        """
+        Convert HTML to markdown in the conversion pool
+        
+        A worker that dies (OOM kill, crash in lxml) breaks the whole pool,
+        so the pool is replaced and the conversion retried once.
+        
+        Args:
+            html: HTML to convert
+            extract_main: Keep only the main content (readability) first
+            
+        Returns:
+            Markdown content
+        """
+        pool = self._conversion_pool
+        try:
+            return pool.submit(_html_to_markdown, html, extract_main=extract_main).result()
+        except BrokenProcessPool:
+            logger.warning("Conversion worker died, restarting the conversion pool")
+            self._replace_conversion_pool(pool)
+            return self._conversion_pool.submit(_html_to_markdown, html, extract_main=extract_main).result()
+    
+    def _replace_conversion_pool(self, broken_pool: ProcessPoolExecutor):
+        """Swap in a new conversion pool, once per broken pool"""
+        with self._conversion_pool_lock:
+            if self._conversion_pool is broken_pool:
+                self._conversion_pool = self._new_conversion_pool()
+                broken_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _load_feed_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load the feed validators saved by the previous run"""
+        try:
+            with open(self._validators_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not load feed cache {self._validators_path}: {e}")
+            return {}
+    
+    def _remember_validators(self, feed_url: str, response):
+        """Keep the ETag / Last-Modified headers of a downloaded feed"""
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        with self._validators_lock:
+            self._new_feed_validators[feed_url] = validators
+    
+    def save_feed_validators(self):
+        """
+        Persist the validators of the feeds downloaded by this run
+        
+        Call once the fetched articles are safely stored: next runs will
+        skip those feeds until they change.
+        """
+        if not self._new_feed_validators:
+            return
+        
+        validators = {**self._feed_validators, **self._new_feed_validators}
+        try:
+            self._validators_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._validators_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(validators, f)
+            tmp_path.replace(self._validators_path)
+            
+            self._feed_validators = validators
+            self._new_feed_validators = {}
+        except Exception as e:
+            logger.warning(f"Could not save feed cache {self._validators_path}: {e}")
+    
+    @contextmanager
+    def _throttle(self, url: str):
+        """Limit concurrent requests per host and space them out politely"""
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.Semaphore(settings.PER_HOST_CONCURRENCY)
+                self._host_slots[host] = slot
+        
+        with slot:
+            try:
+                yield
+            finally:
+                time.sleep(settings.RATE_LIMIT_DELAY)
+    
     def _clean_html(self, html: str) -> str:
         """Clean HTML content to plain text"""
         if not html:
             return ""
         
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
         
         # Remove script and style tags
-        for tag in soup(["script", "style"]):
-            tag.decompose()
+        for node in tree.css("script, style"):
+            node.decompose()
         
-        # Get text
-        text = soup.get_text()
+        # Break lines after block elements only, then get text
+        for node in tree.css(_BLOCK_TAGS):
+            node.insert_after("\n")
+        text = tree.text()
         
         # Clean whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = "\n".join(chunk for chunk in chunks if chunk)
-        
-        return text
+        text = _WS_RUN.sub(" ", text)
+        return _NL_RUN.sub("\n", text).strip()
     
     def _parse_date(self, entry) -> str:
         """Parse and format entry date"""
@@ -2,21 +2,63 @@
 Supabase Service
 Handles reading and writing to Supabase PostgreSQL Database
 """
+import asyncio
+import json
+
+import httpx
+from postgrest.utils import SyncClient, sanitize_param
 from supabase import create_client, Client
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Any, Callable, Iterator, List, Dict, Optional, Set, Tuple
+from urllib.parse import quote
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from threading import Lock
+
+from cachetools import TTLCache
 
 from src.config import settings
+from src.utils.helpers import chunked, normalize_url
 from src.utils.logger import get_logger
+from src.utils.retry import retry_db
 
 logger = get_logger(__name__)
 
+# Columns of the articles table written by add_articles
+FIELDS = (
+    "title", "url", "summary", "author", "published_date",
+    "feed_name", "domain", "extracted_at", "has_full_content",
+)
+
+# Budget for the percent-encoded url=in.(...) filter of a bulk UPDATE,
+# keeping the request line under the common 8 KB proxy/gateway limit
+UPDATE_FILTER_MAX_LENGTH = 6000
+
+# Runs blocking calls for the *_async methods; sized to the HTTP pool so
+# calls do not queue for a connection. Separate from the per-call write
+# pools, which these calls may start themselves.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.SUPABASE_MAX_CONNECTIONS,
+    thread_name_prefix="supabase"
+)
+
+# Marks a URL absent from the lookup cache (None caches "not found")
+_NOT_CACHED = object()
+
 
 class SupabaseService:
     """Service to interact with Supabase PostgreSQL Database"""
 
     def __init__(self):
         self.client: Optional[Client] = None
+        # Recent articles and their URLs, refetched at most once per SUPABASE_CACHE_TTL
+        self._articles_cache: TTLCache = TTLCache(maxsize=2, ttl=settings.SUPABASE_CACHE_TTL)
+        # Single-article lookups by URL, including misses
+        self._url_cache: TTLCache = TTLCache(
+            maxsize=settings.SUPABASE_URL_CACHE_SIZE,
+            ttl=settings.SUPABASE_URL_CACHE_TTL
+        )
+        self._cache_lock = Lock()
         self._initialize()
 
     def _initialize(self):
@@ -26,73 +68,220 @@ class SupabaseService:
                 supabase_url=settings.SUPABASE_URL,
                 supabase_key=settings.SUPABASE_SERVICE_KEY
             )
+            self._configure_http_pool()
             logger.info("Successfully connected to Supabase")
         except Exception as e:
-            logger.error(f"Failed to initialize Supabase: {e}")
+            logger.error("Failed to initialize Supabase: %s", e)
             raise
 
+    def _configure_http_pool(self):
+        """
+        Replace the PostgREST HTTP session with a pooled keep-alive client
+
+        The default session uses httpx defaults; reusing warm HTTP/2
+        connections avoids a TCP + TLS handshake per request. The service
+        key never triggers auth events, so supabase keeps this session.
+        """
+        postgrest = self.client.postgrest
+        default_session = postgrest.session
+
+        limits = httpx.Limits(
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=10,
+            keepalive_expiry=60
+        )
+        postgrest.session = SyncClient(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=httpx.Timeout(connect=5, read=30, write=30, pool=5),
+            transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3),
+            follow_redirects=True
+        )
+        default_session.close()
+
     def get_existing_articles(self) -> List[Dict]:
         """
         Get the 1000 most recent existing articles from Supabase
 
+        Results are cached for SUPABASE_CACHE_TTL seconds and invalidated
+        by any write made through this service.
+
         Returns:
             List of article dictionaries sorted by most recent first
         """
+        with self._cache_lock:
+            cached = self._articles_cache.get("recent")
+        if cached is not None:
+            logger.debug("Using %d cached recent articles from Supabase", len(cached))
+            return cached
+
         try:
-            response = self.client.table(settings.SUPABASE_TABLE_NAME).select("*").order("published_date", desc=True).limit(1000).execute()
-            articles = response.data if response.data else []
-            logger.info(f"Retrieved {len(articles)} recent articles from Supabase")
+            articles = list(self.iter_existing_articles())
+            logger.info("Retrieved %d recent articles from Supabase", len(articles))
+
+            with self._cache_lock:
+                self._articles_cache["recent"] = articles
             return articles
 
         except Exception as e:
-            logger.error(f"Error fetching existing articles from Supabase: {e}")
+            logger.error("Error fetching existing articles from Supabase: %s", e)
             return []
 
-    def add_articles(self, articles: List[Dict]):
+    def get_existing_urls(self) -> Set[str]:
+        """
+        Get the URLs of the 1000 most recent existing articles from Supabase
+
+        Only the url column is selected, which is all deduplication needs.
+        Results share the cache of get_existing_articles.
+
+        Returns:
+            Set of normalized article URLs
+        """
+        with self._cache_lock:
+            cached = self._articles_cache.get("urls")
+        if cached is not None:
+            return cached
+
+        try:
+            urls = {
+                normalize_url(row["url"])
+                for row in self.iter_existing_articles(columns="url", page_size=1000)
+                if row.get("url")
+            }
+            logger.info("Retrieved %d recent article URLs from Supabase", len(urls))
+
+            with self._cache_lock:
+                self._articles_cache["urls"] = urls
+            return urls
+
+        except Exception as e:
+            logger.error("Error fetching existing article URLs from Supabase: %s", e)
+            return set()
+
+    def iter_existing_articles(self, columns: str = "*", page_size: int = 200, limit: int = 1000) -> Iterator[Dict]:
+        """
+        Stream the most recent existing articles page by page
+
+        Pages are requested lazily with Range offsets, so only one page
+        is held in memory at a time.
+
+        Args:
+            columns: Comma-separated columns to select, e.g. "url"
+            page_size: Number of rows per request
+            limit: Maximum number of rows to yield
+
+        Returns:
+            Iterator over article dictionaries, most recent first
+        """
+        offset = 0
+        while offset < limit:
+            end = min(offset + page_size, limit) - 1
+            # url breaks published_date ties so pages do not overlap
+            query = (
+                self.client.table(settings.SUPABASE_TABLE_NAME)
+                .select(columns)
+                .order("published_date", desc=True)
+                .order("url")
+                .range(offset, end)
+            )
+            rows = retry_db(query.execute).data or []
+            yield from rows
+
+            if len(rows) <= end - offset:
+                break
+            offset = end + 1
+
+    def add_articles(self, articles: List[Dict], existing_urls: Optional[Set[str]] = None):
         """
         Add new articles to Supabase, ignoring duplicates
 
+        Known URLs are filtered out client-side first; the ON CONFLICT
+        insert still covers rows written by someone else in the meantime.
+
         Args:
             articles: List of article dictionaries to add
+            existing_urls: Normalized URLs already stored, fetched
+                with get_existing_urls when omitted
         """
         if not articles:
             logger.info("No articles to add to Supabase")
             return
 
         try:
+            if existing_urls is None:
+                existing_urls = self.get_existing_urls()
+            new_articles = [
+                article for article in articles
+                if normalize_url(article.get('url', '')) not in existing_urls
+            ]
+            skipped_count = len(articles) - len(new_articles)
+
+            if not new_articles:
+                logger.info("Added 0 articles to Supabase, skipped %d duplicates", skipped_count)
+                return
+
+            # Prepare article data for Supabase (only fields that exist in the table),
+            # leaving out missing values so the column defaults apply
+            rows = [
+                {field: article[field] for field in FIELDS if article.get(field) is not None}
+                for article in new_articles
+            ]
+
+            # Send batches concurrently: latency ~ slowest batch, not the sum
             added_count = 0
-            skipped_count = 0
-            for article in articles:
-                # Prepare article data for Supabase (only fields that exist in the table)
-                article_data = {
-                    'title': article.get('title', ''),
-                    'url': article.get('url', ''),
-                    'summary': article.get('summary', ''),
-                    'author': article.get('author', ''),
-                    'published_date': article.get('published_date', ''),
-                    'feed_name': article.get('feed_name', ''),
-                    'domain': article.get('domain', ''),
-                    'extracted_at': article.get('extracted_at', ''),
-                    'has_full_content': article.get('has_full_content', False),
-                }
-
-                try:
-                    response = self.client.table(settings.SUPABASE_TABLE_NAME).insert(article_data).execute()
-                    if response.data:
-                        added_count += 1
-                except Exception as e:
-                    # Ignore duplicate key errors (article already exists)
-                    if "duplicate key" in str(e).lower() or "23505" in str(e):
-                        skipped_count += 1
-                    else:
-                        raise
-
-            logger.info(f"Added {added_count} articles to Supabase, skipped {skipped_count} duplicates")
+            chunks = list(chunked(rows, settings.SUPABASE_BATCH_SIZE))
+            with ThreadPoolExecutor(max_workers=settings.SUPABASE_WRITE_WORKERS) as executor:
+                for added, skipped in executor.map(self._insert_chunk, chunks):
+                    added_count += added
+                    skipped_count += skipped
+
+            if added_count:
+                self._invalidate_cache([row['url'] for row in rows if 'url' in row])
+
+            logger.info("Added %d articles to Supabase, skipped %d duplicates", added_count, skipped_count)
 
         except Exception as e:
-            logger.error(f"Error adding articles to Supabase: {e}")
+            logger.error("Error adding articles to Supabase: %s", e)
             raise
 
+    def _invalidate_cache(self, urls: List[str]):
+        """
+        Drop cached reads after a write
+
+        Args:
+            urls: URLs of the articles that were written
+        """
+        with self._cache_lock:
+            self._articles_cache.clear()
+            for url in urls:
+                self._url_cache.pop(url, None)
+
+    def _insert_chunk(self, rows: List[Dict]) -> Tuple[int, int]:
+        """
+        Insert a batch of rows in a single request, ignoring duplicates
+
+        Uses INSERT ... ON CONFLICT (url) DO NOTHING, so existing articles
+        are skipped server-side instead of failing the whole batch. Rows
+        may omit columns; those get their database default.
+
+        Args:
+            rows: Article rows to insert
+
+        Returns:
+            Tuple of (added_count, skipped_count)
+        """
+        query = self.client.table(settings.SUPABASE_TABLE_NAME).upsert(
+            rows,
+            on_conflict="url",
+            ignore_duplicates=True,
+            default_to_null=False
+        )
+        response = retry_db(query.execute)
+
+        # Only inserted rows are returned
+        added_count = len(response.data or [])
+        return added_count, len(rows) - added_count
+
     def update_article(self, url: str, updates: Dict):
         """
         Update an existing article in Supabase
@@ -102,40 +291,142 @@ class SupabaseService:
             updates: Dictionary of fields to update
         """
         try:
-            # Check if article exists
-            response = self.client.table(settings.SUPABASE_TABLE_NAME).select("*").eq("url", url).execute()
+            # Add updated timestamp
+            updates['updated_at'] = datetime.now(timezone.utc).isoformat()
+
+            # The updated rows are returned, so no existence check is needed
+            response = retry_db(self.client.table(settings.SUPABASE_TABLE_NAME).update(updates).eq("url", url).execute)
 
             if response.data:
-                # Add updated timestamp
-                updates['updated_at'] = datetime.utcnow().isoformat()
-                self.client.table(settings.SUPABASE_TABLE_NAME).update(updates).eq("url", url).execute()
-                logger.info(f"Updated article in Supabase: {url}")
+                self._invalidate_cache([url])
+                logger.info("Updated article in Supabase: %s", url)
             else:
-                logger.warning(f"Article not found in Supabase for update: {url}")
+                logger.warning("Article not found in Supabase for update: %s", url)
 
         except Exception as e:
-            logger.error(f"Error updating article in Supabase: {e}")
+            logger.error("Error updating article in Supabase: %s", e)
+
+    def bulk_update(self, updates_by_url: Dict[str, Dict]) -> int:
+        """
+        Update many existing articles with as few requests as possible
+
+        Articles receiving the same field values are updated together in
+        one UPDATE ... WHERE url IN (...). Unlike an upsert, URLs that are
+        not stored are never inserted.
+
+        Args:
+            updates_by_url: Dictionary of fields to update, keyed by article URL
+
+        Returns:
+            Number of articles updated
+        """
+        if not updates_by_url:
+            return 0
+
+        # Group URLs sharing an identical payload
+        groups: Dict[str, Tuple[Dict, List[str]]] = {}
+        for url, fields in updates_by_url.items():
+            key = json.dumps(fields, sort_keys=True, default=str)
+            groups.setdefault(key, (fields, []))[1].append(url)
+
+        updated_at = datetime.now(timezone.utc).isoformat()
+        batches = [
+            ({**fields, 'updated_at': updated_at}, urls_batch)
+            for fields, urls in groups.values()
+            for urls_batch in _batch_by_filter_length(urls, UPDATE_FILTER_MAX_LENGTH)
+        ]
+
+        # Collect each batch separately so one failure doesn't hide the others
+        updated_count = 0
+        failed_count = 0
+        try:
+            with ThreadPoolExecutor(max_workers=settings.SUPABASE_WRITE_WORKERS) as executor:
+                futures = [executor.submit(self._update_batch, fields, urls) for fields, urls in batches]
+                for future, (_, urls) in zip(futures, batches):
+                    try:
+                        updated_count += future.result()
+                    except Exception as e:
+                        failed_count += len(urls)
+                        logger.error("Error bulk updating %d articles in Supabase: %s", len(urls), e)
+
+        finally:
+            self._invalidate_cache(list(updates_by_url))
+
+        missing_count = len(updates_by_url) - updated_count - failed_count
+        logger.info(
+            "Updated %d articles in Supabase in %d requests, %d not found, %d failed",
+            updated_count, len(batches), missing_count, failed_count
+        )
+        return updated_count
+
+    def _update_batch(self, fields: Dict, urls: List[str]) -> int:
+        """
+        Apply the same field values to a batch of articles
+
+        Args:
+            fields: Fields to update
+            urls: URLs of the articles to update
+
+        Returns:
+            Number of articles updated
+        """
+        response = retry_db(self.client.table(settings.SUPABASE_TABLE_NAME).update(fields).in_("url", urls).execute)
+        return len(response.data or [])
+
+    def article_exists(self, url: str) -> bool:
+        """
+        Check whether an article is stored, without fetching the row
+
+        Only the url column of at most one row is transferred.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            True if the article exists, False otherwise
+        """
+        with self._cache_lock:
+            cached = self._url_cache.get(url, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached is not None
+
+        try:
+            response = retry_db(self.client.table(settings.SUPABASE_TABLE_NAME).select("url").eq("url", url).limit(1).execute)
+            return bool(response.data)
+
+        except Exception as e:
+            logger.error("Error checking article in Supabase: %s", e)
+            return False
 
     def get_article_by_url(self, url: str) -> Optional[Dict]:
         """
         Get a specific article by URL
 
+        Lookups, including misses, are cached for SUPABASE_URL_CACHE_TTL
+        seconds and invalidated by writes made through this service.
+
         Args:
             url: Article URL
 
         Returns:
             Article dictionary or None if not found
         """
-        try:
-            response = self.client.table(settings.SUPABASE_TABLE_NAME).select("*").eq("url", url).execute()
+        with self._cache_lock:
+            cached = self._url_cache.get(url, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            # Callers get their own copy, so mutating it can't corrupt the cache
+            return dict(cached) if cached is not None else None
 
-            if response.data and len(response.data) > 0:
-                return response.data[0]
+        try:
+            response = retry_db(self.client.table(settings.SUPABASE_TABLE_NAME).select("*").eq("url", url).execute)
+            article = response.data[0] if response.data else None
 
-            return None
+            with self._cache_lock:
+                self._url_cache[url] = dict(article) if article is not None else None
+            return article
 
         except Exception as e:
-            logger.error(f"Error fetching article from Supabase: {e}")
+            logger.error("Error fetching article from Supabase: %s", e)
             return None
 
     def delete_article(self, url: str):
@@ -146,14 +437,99 @@ class SupabaseService:
             url: Article URL to identify the record
         """
         try:
-            # Check if article exists
-            response = self.client.table(settings.SUPABASE_TABLE_NAME).select("*").eq("url", url).execute()
+            # The deleted rows are returned, so no existence check is needed
+            response = retry_db(self.client.table(settings.SUPABASE_TABLE_NAME).delete().eq("url", url).execute)
 
             if response.data:
-                self.client.table(settings.SUPABASE_TABLE_NAME).delete().eq("url", url).execute()
-                logger.info(f"Deleted article from Supabase: {url}")
+                self._invalidate_cache([url])
+                logger.info("Deleted article from Supabase: %s", url)
             else:
-                logger.warning(f"Article not found in Supabase for deletion: {url}")
+                logger.warning("Article not found in Supabase for deletion: %s", url)
 
         except Exception as e:
-            logger.error(f"Error deleting article from Supabase: {e}")
+            logger.error("Error deleting article from Supabase: %s", e)
+
+    async def _run_async(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking method on the shared executor without blocking the event loop
+
+        Args:
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_EXECUTOR, partial(fn, *args, **kwargs))
+
+    async def get_existing_articles_async(self) -> List[Dict]:
+        """Async variant of get_existing_articles"""
+        return await self._run_async(self.get_existing_articles)
+
+    async def get_existing_urls_async(self) -> Set[str]:
+        """Async variant of get_existing_urls"""
+        return await self._run_async(self.get_existing_urls)
+
+    async def add_articles_async(self, articles: List[Dict], existing_urls: Optional[Set[str]] = None):
+        """Async variant of add_articles"""
+        return await self._run_async(self.add_articles, articles, existing_urls=existing_urls)
+
+    async def update_article_async(self, url: str, updates: Dict):
+        """Async variant of update_article"""
+        return await self._run_async(self.update_article, url, updates)
+
+    async def bulk_update_async(self, updates_by_url: Dict[str, Dict]) -> int:
+        """Async variant of bulk_update"""
+        return await self._run_async(self.bulk_update, updates_by_url)
+
+    async def article_exists_async(self, url: str) -> bool:
+        """Async variant of article_exists"""
+        return await self._run_async(self.article_exists, url)
+
+    async def get_article_by_url_async(self, url: str) -> Optional[Dict]:
+        """Async variant of get_article_by_url"""
+        return await self._run_async(self.get_article_by_url, url)
+
+    async def delete_article_async(self, url: str):
+        """Async variant of delete_article"""
+        return await self._run_async(self.delete_article, url)
+
+
+def _batch_by_filter_length(urls: List[str], max_length: int) -> Iterator[List[str]]:
+    """
+    Split URLs into batches whose encoded in.(...) filter fits max_length
+
+    Args:
+        urls: URLs to split
+        max_length: Maximum percent-encoded length of a batch's filter
+
+    Returns:
+        Iterator over lists of URLs; a URL longer than max_length gets its own batch
+    """
+    batch: List[str] = []
+    length = 0
+    for url in urls:
+        # Quoted value plus the encoded comma separator (%2C)
+        url_length = len(quote(sanitize_param(url), safe="")) + 3
+        if batch and length + url_length > max_length:
+            yield batch
+            batch, length = [], 0
+        batch.append(url)
+        length += url_length
+    if batch:
+        yield batch
+
+
+@lru_cache(maxsize=1)
+def get_supabase_service() -> SupabaseService:
+    """
+    Get the process-wide Supabase service
+
+    The client and its HTTP connection pool are built once and reused.
+
+    Returns:
+        Shared SupabaseService instance
+    """
+    return SupabaseService()
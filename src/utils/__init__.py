@@ -1,4 +1,4 @@
 from .logger import get_logger
-from .helpers import validate_url, truncate_text
+from .helpers import validate_url, validate_urls, normalize_url, truncate_text
 
-__all__ = ["get_logger", "validate_url", "truncate_text"]
+__all__ = ["get_logger", "validate_url", "validate_urls", "normalize_url", "truncate_text"]
@@ -1,7 +1,13 @@
 """
 Helper utility functions
 """
-from urllib.parse import urlparse
+import re
+from typing import Iterable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Scheme followed by a non-empty network location, like urlparse's scheme + netloc
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://[^\s/?#]+")
 
 
 def validate_url(url: str) -> bool:
@@ -14,11 +20,37 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    return bool(url) and _URL_RE.match(url) is not None
+
+
+def validate_urls(urls: Iterable[str]) -> List[bool]:
+    """
+    Validate many URLs at once
+    
+    Args:
+        urls: URL strings to validate
+        
+    Returns:
+        List with True for each valid URL, False otherwise
+    """
+    match = _URL_RE.match
+    return [bool(url) and match(url) is not None for url in urls]
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection
+    
+    Args:
+        url: URL string to normalize
+        
+    Returns:
+        URL without surrounding whitespace and trailing slash
+    """
+    if not url:
+        return ""
+    
+    return url.strip().rstrip("/")
 
 
 def truncate_text(text: str, max_length: int = 500, suffix: str = "...") -> str:
@@ -39,7 +71,10 @@ def truncate_text(text: str, max_length: int = 500, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
     
-    return text[:max_length - len(suffix)].rsplit(' ', 1)[0] + suffix
+    # Cut at the last word boundary before the limit, if any
+    cap = max_length - len(suffix)
+    space = text.rfind(' ', 0, cap)
+    return (text[:space] if space > 0 else text[:cap]) + suffix
 
 
 def sanitize_filename(filename: str) -> str:
@@ -58,3 +93,18 @@ def sanitize_filename(filename: str) -> str:
         filename = filename.replace(char, '_')
     
     return filename.strip()
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    """
+    Split a sequence into consecutive chunks
+    
+    Args:
+        items: Sequence to split
+        size: Maximum chunk size
+        
+    Returns:
+        Iterator over lists of at most size items
+    """
+    for i in range(0, len(items), size):
+        yield list(items[i:i + size])
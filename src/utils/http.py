@@ -0,0 +1,34 @@
+"""
+Shared HTTP session
+"""
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session
+    
+    The session is thread-safe for GET requests and keeps a connection
+    pool per host, so every service should reuse it instead of calling
+    requests.get directly.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": settings.USER_AGENT})
+    
+    adapter = HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_SIZE,
+        pool_maxsize=settings.PER_HOST_CONCURRENCY
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    return session
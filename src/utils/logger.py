@@ -5,34 +5,36 @@ import logging
 import sys
 from src.config import settings
 
+_configured = False
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get a configured logger instance
     
+    A single stdout handler is installed on the root logger the first
+    time this is called; module loggers propagate to it instead of each
+    owning a handler. The root stays at WARNING so third-party libraries
+    (httpx logs every request at INFO) are not promoted to LOG_LEVEL.
+    
     Args:
         name: Logger name (typically __name__)
         
     Returns:
         Configured logger
     """
-    logger = logging.getLogger(name)
-    
-    # Only configure if not already configured
-    if not logger.handlers:
-        logger.setLevel(getattr(logging, settings.LOG_LEVEL))
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.DEBUG)
-        
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    global _configured
+    if not _configured:
+        # No-op if the root logger was already configured by the caller
+        logging.basicConfig(
+            level=logging.WARNING,
+            stream=sys.stdout,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        console_handler.setFormatter(formatter)
-        
-        logger.addHandler(console_handler)
+        _configured = True
+    
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, settings.LOG_LEVEL))
     
     return logger
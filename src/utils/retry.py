@@ -0,0 +1,69 @@
+"""
+Retry helpers for transient database errors
+"""
+import random
+import time
+from typing import Callable, TypeVar
+
+import httpx
+from postgrest.exceptions import APIError
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Network failures that leave the request unapplied or safe to resend
+TRANSIENT_ERRORS = (
+    httpx.ConnectError,
+    httpx.PoolTimeout,
+    httpx.ReadTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Check whether a Supabase error is worth retrying
+    
+    Connection failures and 5xx responses are transient; constraint
+    violations such as 23505 (duplicate key) and other 4xx are not.
+    
+    Args:
+        error: Exception raised by a Supabase call
+        
+    Returns:
+        True if the call should be retried, False otherwise
+    """
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    if isinstance(error, APIError):
+        # PostgREST reports the HTTP status as the code for non-JSON errors
+        code = str(error.code or "")
+        return len(code) == 3 and code.startswith("5")
+    return False
+
+
+def retry_db(fn: Callable[[], T], max_retries: int = 6, base: float = 0.2, cap: float = 10) -> T:
+    """
+    Call fn, retrying transient errors with jittered exponential backoff
+    
+    Args:
+        fn: Zero-argument callable, e.g. a query builder's execute
+        max_retries: Number of retries before the error is re-raised
+        base: Initial delay in seconds
+        cap: Maximum delay in seconds
+        
+    Returns:
+        Result of fn
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_retries or not is_transient(e):
+                raise
+            delay = min(cap, base * 2 ** attempt) + random.uniform(0, 0.1)
+            logger.warning("Transient database error (%s), retrying in %.2fs", e, delay)
+            time.sleep(delay)